@@ -180,11 +180,15 @@ for log_entry in ds.position.log:
 # Add velocity data variable to the dataset
 ds["velocity"] = compute_velocity(ds.position)
 
+# Threshold the confidence scores once, then apply the resulting boolean
+# mask to each data variable. This is equivalent to calling
+# ``filter_by_confidence`` per variable, but avoids re-comparing the same
+# confidence scores against the threshold for every variable.
+confidence_mask = ds.confidence >= 0.6
+
 # Create a dictionary mapping data variable names to filtered DataArrays
-# We disable report printing for brevity
 update_dict = {
-    var: filter_by_confidence(ds[var], ds.confidence)
-    for var in ["position", "velocity"]
+    var: ds[var].where(confidence_mask) for var in ["position", "velocity"]
 }
 
 # Use the dictionary to update the dataset in-place
@@ -259,13 +259,16 @@ def savgol_filter(
         raise log_error(
             ValueError, "The 'axis' argument may not be overridden."
         )
-    data_smoothed = data.copy()
-    data_smoothed.values = signal.savgol_filter(
-        data,
-        window,
-        polyorder,
-        axis=0,
-        **kwargs,
+    # Wrap the filtered values directly, rather than copying the input
+    # array only to overwrite every element afterwards
+    data_smoothed = data.copy(
+        data=signal.savgol_filter(
+            data,
+            window,
+            polyorder,
+            axis=0,
+            **kwargs,
+        )
     )
     if print_report:
         print(report_nan_values(data, "input"))
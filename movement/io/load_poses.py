@@ -465,8 +465,6 @@ def _ds_from_sleap_analysis_file(
     with h5py.File(file.path, "r") as f:
         # Transpose to shape: (n_frames, n_space, n_keypoints, n_tracks)
         tracks = f["tracks"][:].transpose(3, 1, 2, 0)
-        # Create an array of NaNs for the confidence scores
-        scores = np.full(tracks.shape[:1] + tracks.shape[2:], np.nan)
         individual_names = [n.decode() for n in f["track_names"][:]] or None
         if individual_names is None:
             log_warning(
@@ -475,9 +473,12 @@ def _ds_from_sleap_analysis_file(
                 "default individual name."
             )
         # If present, read the point-wise scores,
-        # and transpose to shape: (n_frames, n_keypoints, n_tracks)
+        # and transpose to shape: (n_frames, n_keypoints, n_tracks);
+        # otherwise, create an array of NaNs for the confidence scores
         if "point_scores" in f:
             scores = f["point_scores"][:].T
+        else:
+            scores = np.full(tracks.shape[:1] + tracks.shape[2:], np.nan)
         return from_numpy(
             position_array=tracks.astype(np.float32),
             confidence_array=scores.astype(np.float32),
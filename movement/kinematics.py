@@ -18,6 +18,14 @@ from movement.utils.vector import (
 )
 from movement.validators.arrays import validate_dims_coords
 
+# Upward direction in the image coordinate system, per camera view.
+# Unrecognised views fall back to "bottom_up", matching the previous
+# if/else behaviour.
+_UPWARD_VECTOR_PER_VIEW = {
+    "top_down": np.array([0, 0, -1]),
+    "bottom_up": np.array([0, 0, 1]),
+}
+
 
 def compute_displacement(data: xr.DataArray) -> xr.DataArray:
     """Compute displacement array in cartesian coordinates.
@@ -290,14 +298,13 @@ def compute_forward_vector(
     ) - data.sel(keypoints=right_keypoint, drop=True)
     # Define upward vector
     # default: negative z direction in the image coordinate system
-    upward_vector = (
-        np.array([0, 0, -1])
-        if camera_view == "top_down"
-        else np.array([0, 0, 1])
-    )
+    # A single 3-vector suffices: xr.cross broadcasts it across time,
+    # so there is no need to tile a full (n_frames, 3) array
     upward_vector = xr.DataArray(
-        np.tile(upward_vector.reshape(1, -1), [len(data.time), 1]),
-        dims=["time", "space"],
+        _UPWARD_VECTOR_PER_VIEW.get(
+            camera_view, _UPWARD_VECTOR_PER_VIEW["bottom_up"]
+        ),
+        dims=["space"],
         coords={
             "space": ["x", "y", "z"],
         },
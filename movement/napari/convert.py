@@ -11,15 +11,47 @@ logger = logging.getLogger(__name__)
 
 
 def _construct_properties_dataframe(ds: xr.Dataset) -> pd.DataFrame:
-    """Construct a properties DataFrame from a ``movement`` dataset."""
+    """Construct a properties DataFrame from a ``movement`` dataset.
+
+    Rows are ordered by individual, then keypoint (if present), then time,
+    matching the layout of the napari Tracks array.
+    """
+    n_frames = ds.sizes["time"]
+    n_individuals = ds.sizes["individuals"]
+    n_keypoints = ds.sizes.get("keypoints", 1)
+
+    # Expand the 1D coordinates to one entry per track point
+    # with repeat/tile, rather than stacking the whole dataset
+    # (which would build an expensive, never-used MultiIndex).
+    # For the name columns, repeat/tile small integer code arrays and
+    # wrap them as Categorical columns, so each name is stored once and
+    # every per-point entry is a compact integer code.
+    individual_codes = np.repeat(
+        np.arange(n_individuals), n_keypoints * n_frames
+    )
     data = {
-        "individual": ds.coords["individuals"].values,
-        "time": ds.coords["time"].values,
-        "confidence": ds["confidence"].values.flatten(),
+        "individual": pd.Categorical.from_codes(
+            individual_codes, categories=ds.coords["individuals"].values
+        ),
+        "time": np.tile(ds.coords["time"].values, n_individuals * n_keypoints),
+        "confidence": ds["confidence"]
+        .transpose(
+            *(
+                dim
+                for dim in ("individuals", "keypoints", "time")
+                if dim in ds["confidence"].dims
+            )
+        )
+        .values.reshape(-1),
     }
     desired_order = list(data.keys())
     if "keypoints" in ds.coords:
-        data["keypoint"] = ds.coords["keypoints"].values
+        keypoint_codes = np.tile(
+            np.repeat(np.arange(n_keypoints), n_frames), n_individuals
+        )
+        data["keypoint"] = pd.Categorical.from_codes(
+            keypoint_codes, categories=ds.coords["keypoints"].values
+        )
         desired_order.insert(1, "keypoint")
 
     # sort
@@ -28,7 +60,11 @@ def _construct_properties_dataframe(ds: xr.Dataset) -> pd.DataFrame:
 
 def ds_to_napari_tracks(
     ds: xr.Dataset,
-) -> tuple[np.ndarray, pd.DataFrame]:
+    return_valid_mask: bool = False,
+) -> (
+    tuple[np.ndarray, pd.DataFrame]
+    | tuple[np.ndarray, pd.DataFrame, np.ndarray]
+):
     """Convert ``movement`` dataset to napari Tracks array and properties.
 
     Parameters
@@ -36,6 +72,10 @@ def ds_to_napari_tracks(
     ds : xr.Dataset
         ``movement`` dataset containing pose or bounding box tracks,
         confidence scores, and associated metadata.
+    return_valid_mask : bool
+        Whether to additionally return a boolean mask that is True for
+        rows of the Tracks array free of NaN position values.
+        Default: False.
 
     Returns
     -------
@@ -45,6 +85,9 @@ def ds_to_napari_tracks(
         and the 4 columns are (track_id, frame_idx, y, x).
     properties : pd.DataFrame
         DataFrame with properties (individual, keypoint, time, confidence).
+    valid_mask : np.ndarray
+        Boolean array of shape (N,), True for rows whose y, x values are
+        not NaN. Only returned if ``return_valid_mask`` is True.
 
     Notes
     -----
@@ -68,24 +111,36 @@ def ds_to_napari_tracks(
     axes_reordering: tuple[int, ...] = (2, 0, 1)
     if "keypoints" in ds.coords:
         axes_reordering = (3,) + axes_reordering
-    yx_cols = np.transpose(
-        ds.position.values,  # from: frames, xy, keypoints, individuals
-        axes_reordering,  # to: individuals, keypoints, frames, xy
-    ).reshape(-1, 2)[:, [1, 0]]  # swap x and y columns
-
-    # Each keypoint of each individual is a separate track
-    track_id_col = np.repeat(np.arange(n_tracks), n_frames).reshape(-1, 1)
-    time_col = np.tile(np.arange(n_frames), (n_tracks)).reshape(-1, 1)
-    data = np.hstack((track_id_col, time_col, yx_cols))
-
-    # Construct the properties DataFrame
-    # Stack individuals, time and keypoints (if present) dimensions
-    # into a new single dimension named "tracks"
-    dimensions_to_stack: tuple[str, ...] = ("individuals", "time")
-    if "keypoints" in ds.coords:
-        dimensions_to_stack += ("keypoints",)  # add last
-    ds_ = ds.stack(tracks=sorted(dimensions_to_stack))
-
-    properties = _construct_properties_dataframe(ds_)
-
+    # Make the reordered position block C-contiguous up front (a single
+    # copy), so the reshape below is a free view and the column writes
+    # into the Tracks array read from contiguous memory.
+    xy_cols = np.ascontiguousarray(
+        np.transpose(
+            ds.position.values,  # from: frames, xy, keypoints, individuals
+            axes_reordering,  # to: individuals, keypoints, frames, xy
+        )
+    ).reshape(-1, 2)
+
+    # Preallocate the final array and fill the columns in place,
+    # rather than stacking intermediate per-column arrays with hstack.
+    # Each keypoint of each individual is a separate track.
+    # The x and y columns are written out individually in swapped order,
+    # avoiding the copy that fancy-indexing the column pair would make.
+    data = np.empty((n_tracks * n_frames, 4))
+    # Broadcast the small arange vectors straight into per-track views of
+    # the id columns, skipping the repeat/tile temporaries of full length
+    per_track = data.reshape(n_tracks, n_frames, 4)
+    per_track[:, :, 0] = np.arange(n_tracks)[:, None]
+    per_track[:, :, 1] = np.arange(n_frames)
+    data[:, 2] = xy_cols[:, 1]
+    data[:, 3] = xy_cols[:, 0]
+
+    # Construct the properties DataFrame,
+    # with one row per point in the Tracks array
+    properties = _construct_properties_dataframe(ds)
+
+    if return_valid_mask:
+        # The mask is derived from the xy block already at hand,
+        # saving consumers a fresh NaN scan over the Tracks array
+        return data, properties, ~np.isnan(xy_cols).any(axis=1)
     return data, properties
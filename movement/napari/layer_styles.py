@@ -64,7 +64,13 @@ class PointsStyle(LayerStyle):
         # Get color cycle
         if cmap is None:
             cmap = self.face_colormap
-        n_colors = len(self.properties[prop].unique())
+        # Categorical columns already record their distinct values in the
+        # dtype, so we can skip a full hash-based scan of the column
+        prop_values = self.properties[prop]
+        if isinstance(prop_values.dtype, pd.CategoricalDtype):
+            n_colors = len(prop_values.cat.categories)
+        else:
+            n_colors = len(prop_values.unique())
         color_cycle = _sample_colormap(n_colors, cmap)
 
         # Set color cycle for points and text
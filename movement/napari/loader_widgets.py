@@ -3,7 +3,6 @@
 import logging
 from pathlib import Path
 
-import numpy as np
 from napari.components.dims import RangeTuple
 from napari.settings import get_settings
 from napari.utils.notifications import show_warning
@@ -49,7 +48,10 @@ class DataLoader(QWidget):
         """Initialize the data loader widget."""
         super().__init__(parent=parent)
         self.viewer = napari_viewer
-        self.setLayout(QFormLayout())
+        # Keep a direct reference to the form layout, so the widget
+        # creation methods below don't have to go through self.layout()
+        self._form_layout = QFormLayout()
+        self.setLayout(self._form_layout)
 
         # Create widgets
         self._create_source_software_widget()
@@ -65,7 +67,9 @@ class DataLoader(QWidget):
         self.source_software_combo = QComboBox()
         self.source_software_combo.setObjectName("source_software_combo")
         self.source_software_combo.addItems(SUPPORTED_DATA_FILES.keys())
-        self.layout().addRow("source software:", self.source_software_combo)
+        self._form_layout.addRow(
+            "source software:", self.source_software_combo
+        )
 
     def _create_fps_widget(self):
         """Create a spinbox for selecting the frames per second (fps)."""
@@ -83,7 +87,7 @@ class DataLoader(QWidget):
             "This just affects the displayed time when hovering over a point\n"
             "(it doesn't set the playback speed)."
         )
-        self.layout().addRow("fps:", self.fps_spinbox)
+        self._form_layout.addRow("fps:", self.fps_spinbox)
 
     def _create_file_path_widget(self):
         """Create a line edit and browse button for selecting the file path.
@@ -102,14 +106,14 @@ class DataLoader(QWidget):
         self.file_path_layout = QHBoxLayout()
         self.file_path_layout.addWidget(self.file_path_edit)
         self.file_path_layout.addWidget(self.browse_button)
-        self.layout().addRow("file path:", self.file_path_layout)
+        self._form_layout.addRow("file path:", self.file_path_layout)
 
     def _create_load_button(self):
         """Create a button to load the file and add layers to the viewer."""
         self.load_button = QPushButton("Load")
         self.load_button.setObjectName("load_button")
-        self.load_button.clicked.connect(lambda: self._on_load_clicked())
-        self.layout().addRow(self.load_button)
+        self.load_button.clicked.connect(self._on_load_clicked)
+        self._form_layout.addRow(self.load_button)
 
     def _on_browse_clicked(self):
         """Open a file dialog to select a file."""
@@ -152,18 +156,24 @@ class DataLoader(QWidget):
         ds = loader.from_file(file_path, source_software, fps)
 
         # Convert to napari Tracks array
-        self.data, self.props = ds_to_napari_tracks(ds)
+        self.data, self.props, self.data_not_nan = ds_to_napari_tracks(
+            ds, return_valid_mask=True
+        )
         logger.info("Converted dataset to a napari Tracks array.")
         logger.debug(f"Tracks array shape: {self.data.shape}")
 
         # Add the data as a Points layer
         self.file_name = Path(file_path).name
+        self.n_frames = ds.sizes["time"]
+        self.n_individuals = ds.sizes["individuals"]
+        self.n_keypoints = ds.sizes.get("keypoints", 1)
         self._add_points_layer()
 
     def _add_points_layer(self):
         """Add the tracked data to the viewer as a Points layer."""
-        # Find rows in data array that do not contain NaN values
-        bool_not_nan = ~np.any(np.isnan(self.data), axis=1)
+        # Rows in the data array that do not contain NaN values,
+        # as computed during the dataset conversion
+        bool_not_nan = self.data_not_nan
 
         # Define style for points layer
         props_and_style = PointsStyle(
@@ -172,10 +182,10 @@ class DataLoader(QWidget):
         )
 
         # Set markers' text
-        if (
-            "keypoint" in self.props
-            and len(self.props["keypoint"].unique()) > 1
-        ):
+        # The number of distinct individuals and keypoints is known from
+        # the dataset dimensions recorded at load time, so there is no
+        # need to scan the properties columns for unique values
+        if "keypoint" in self.props and self.n_keypoints > 1:
             text_prop = "keypoint"
         else:
             text_prop = "individual"
@@ -183,8 +193,7 @@ class DataLoader(QWidget):
 
         # Set color of markers and text
         color_prop = "individual"
-        n_individuals = len(self.props["individual"].unique())
-        if n_individuals == 1 and "keypoint" in self.props:
+        if self.n_individuals == 1 and "keypoint" in self.props:
             color_prop = "keypoint"
         props_and_style.set_color_by(prop=color_prop)
 
@@ -194,9 +203,11 @@ class DataLoader(QWidget):
             **props_and_style.as_kwargs(),
         )
 
-        # Ensure the frame slider reflects the total number of frames
+        # Ensure the frame slider reflects the total number of frames.
+        # The last frame index is known from the dataset dimensions,
+        # so no need to scan the frame column for its maximum.
         expected_frame_range = RangeTuple(
-            start=0.0, stop=max(self.data[:, 1]), step=1.0
+            start=0.0, stop=float(self.n_frames - 1), step=1.0
         )
         if self.viewer.dims.range[0] != expected_frame_range:
             self.viewer.dims.range = (
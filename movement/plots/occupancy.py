@@ -156,17 +156,35 @@ def plot_occupancy(
     x_coord = data["space"].values[0]
     y_coord = data["space"].values[1]
 
+    # Extract both coordinates as NumPy arrays in one go,
+    # rather than selecting from the DataArray twice.
+    xy_values = data.transpose("time", "space").values
+    x_values = xy_values[:, 0]
+    y_values = xy_values[:, 1]
+
     # Inherit our defaults if not otherwise provided
     for key, value in DEFAULT_HIST_ARGS.items():
         if key not in kwargs:
             kwargs[key] = value
+    # When binning into a fixed number of uniform bins, pre-compute the bin
+    # ranges from the data extent so that the underlying np.histogram2d call
+    # can take its fast uniform-bin path with known edges.
+    if (
+        isinstance(kwargs["bins"], int)
+        and kwargs.get("range") is None
+        and x_values.size > 0
+    ):
+        kwargs["range"] = (
+            (x_values.min(), x_values.max()),
+            (y_values.min(), y_values.max()),
+        )
     # Now it should just be a case of creating the histogram
     if ax is not None:
         fig = ax.get_figure()
     else:
         fig, ax = plt.subplots()
     counts, xedges, yedges, hist_image = ax.hist2d(
-        data.sel(space=x_coord), data.sel(space=y_coord), **kwargs
+        x_values, y_values, **kwargs
     )
     colourbar = fig.colorbar(hist_image, ax=ax)
     colourbar.solids.set(alpha=1.0)
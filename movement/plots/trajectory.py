@@ -62,11 +62,10 @@ def plot_centroid_trajectory(
         else:
             selection["individuals"] = individual
 
-    if "keypoints" in da.dims:
-        if keypoints is None:
-            selection["keypoints"] = da.keypoints.values
-        else:
-            selection["keypoints"] = keypoints
+    # Selecting all keypoints would copy the data via fancy indexing,
+    # so only select when a subset was requested
+    if "keypoints" in da.dims and keypoints is not None:
+        selection["keypoints"] = keypoints
 
     plot_point = da.sel(**selection)
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Hashable, Sequence
-from typing import Any, Literal, TypeAlias
+from typing import Any, Literal, Self, TypeAlias
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -12,7 +12,6 @@ import xarray as xr
 from numpy.typing import ArrayLike
 from shapely.coords import CoordinateSequence
 
-from movement.utils.broadcasting import broadcastable_method
 from movement.utils.logging import log_error
 from movement.utils.vector import compute_signed_angle_2d
 
@@ -22,6 +21,10 @@ PointLikeList: TypeAlias = Sequence[PointLike] | np.ndarray
 RegionLike: TypeAlias = shapely.Polygon
 SupportedGeometry: TypeAlias = LineLike | RegionLike
 
+# Default reference direction for allocentric angles: the positive x-axis.
+# Allocated once; never mutated by the angle computations.
+_DEFAULT_REFERENCE_VECTOR = np.array([1.0, 0.0])
+
 
 class BaseRegionOfInterest:
     """Base class for regions of interest (RoIs).
@@ -103,7 +106,7 @@ class BaseRegionOfInterest:
     @property
     def dimensions(self) -> int:
         """Dimensionality of the region."""
-        return shapely.get_dimensions(self.region)
+        return self._dimensions
 
     @property
     def is_closed(self) -> bool:
@@ -113,10 +116,7 @@ class BaseRegionOfInterest:
         - A polygon (2D RoI).
         - A 1D LoI whose final point connects back to its first.
         """
-        return self.dimensions > 1 or (
-            self.dimensions == 1
-            and self.region.coords[0] == self.region.coords[-1]
-        )
+        return self._is_closed
 
     @property
     def name(self) -> str:
@@ -269,73 +269,143 @@ class BaseRegionOfInterest:
             )
             self._shapely_geometry = shapely.normalize(self._shapely_geometry)
 
+        self._post_init_cache()
+
+    @classmethod
+    def _from_geometry(
+        cls,
+        geometry: SupportedGeometry,
+        name: str | None = None,
+    ) -> Self:
+        """Construct a region directly from an existing geometry.
+
+        Intended for internal use, when a suitable ``shapely`` geometry is
+        already at hand (e.g. a ring extracted from an existing polygon);
+        bypasses the argument validation and geometry construction performed
+        by ``__init__``.
+
+        Parameters
+        ----------
+        geometry : shapely.LineString | shapely.LinearRing | shapely.Polygon
+            Geometry to wrap in the region. 1D geometries are expected to be
+            normalised, as ``__init__`` would produce them.
+        name : str, optional
+            Human-readable name to assign to the given region.
+
+        """
+        obj = cls.__new__(cls)
+        obj._name = name
+        obj._shapely_geometry = geometry
+        obj._post_init_cache()
+        return obj
+
+    def _post_init_cache(self) -> None:
+        """Cache geometry-derived quantities that are read on every query.
+
+        Called at the end of construction, so that repeated method calls
+        don't re-dispatch to GEOS for values that are fixed once the wrapped
+        geometry exists.
+        """
+        self._boundary = self._shapely_geometry.boundary
+        self._dimensions = int(shapely.get_dimensions(self._shapely_geometry))
+        # Materialise the defining coordinates as a float array once;
+        # indexing a CoordinateSequence unpacks from GEOS on every access
+        self._coords_np = np.asarray(
+            self._shapely_geometry.coords
+            if self._dimensions < 2
+            else self._shapely_geometry.exterior.coords,
+            dtype=np.float64,
+        )
+        self._is_closed = self._dimensions > 1 or np.array_equal(
+            self._coords_np[0], self._coords_np[-1]
+        )
+        # Prepare the geometries: GEOS builds an indexed edge structure
+        # once, accelerating the repeated containment, intersection, and
+        # distance queries that the methods below issue against them
+        shapely.prepare(self._shapely_geometry)
+        shapely.prepare(self._boundary)
+
     def __repr__(self) -> str:  # noqa: D105
         return str(self)
 
     def __str__(self) -> str:  # noqa: D105
         display_type = "-gon" if self.dimensions > 1 else " line segment(s)"
-        n_points = len(self.coords) - 1
+        n_points = len(self._coords_np) - 1
         return (
             f"{self.__class__.__name__} {self.name} "
             f"({n_points}{display_type})\n"
-        ) + " -> ".join(f"({c[0]}, {c[1]})" for c in self.coords)
+        ) + " -> ".join(f"({c[0]}, {c[1]})" for c in self._coords_np)
 
     def _plot(
         self, fig: plt.Figure, ax: plt.Axes, **matplotlib_kwargs
     ) -> tuple[plt.Figure, plt.Axes]:
         raise NotImplementedError("_plot must be implemented by subclass.")
 
-    @broadcastable_method(only_broadcastable_along="space")
     def contains_point(
         self,
         /,
-        position: ArrayLike,
+        position: ArrayLike | xr.DataArray,
         include_boundary: bool = True,
-    ) -> bool:
+    ) -> bool | xr.DataArray:
         """Determine if a position is inside the region of interest.
 
         Parameters
         ----------
-        position : ArrayLike
+        position : ArrayLike | xarray.DataArray
             Spatial coordinates [x, y, [z]] to check as being inside the
-            region.
+            region. An ``xarray.DataArray`` of such coordinates may also be
+            provided, in which case the check is broadcast along its
+            ``"space"`` dimension.
         include_boundary : bool
             Whether to treat a position on the region's boundary as inside the
             region (True) or outside the region (False). Default True.
 
         Returns
         -------
-        bool
+        bool | xarray.DataArray
             True if the ``position`` provided is within the region of interest.
-            False otherwise.
+            False otherwise. ``DataArray`` inputs give a boolean ``DataArray``
+            of results, with the ``space`` dimension collapsed.
+
+        Notes
+        -----
+        A region includes the points that make up its boundary, and the points
+        making up the boundary of that boundary, and so on. As such, including
+        the boundary amounts to an intersection query, while excluding it
+        amounts to a (strict) containment query. Both queries are dispatched
+        to ``shapely`` in a single (vectorised) call.
 
         """
+        if isinstance(position, xr.DataArray):
+            in_region = (
+                shapely.intersects_xy
+                if include_boundary
+                else shapely.contains_xy
+            )
+            return xr.apply_ufunc(
+                lambda xy: in_region(self.region, xy[..., 0], xy[..., 1]),
+                position,
+                input_core_dims=[["space"]],
+            )
         point = shapely.Point(position)
+        return (
+            self.region.intersects(point)
+            if include_boundary
+            else self.region.contains(point)
+        )
 
-        current_region = self.region
-        point_is_inside = current_region.contains(point)
-
-        if include_boundary:
-            # 2D objects have 1D object boundaries,
-            # which in turn have point-boundaries.
-            while not current_region.boundary.is_empty:
-                current_region = current_region.boundary
-                point_is_inside = point_is_inside or current_region.contains(
-                    point
-                )
-        return point_is_inside
-
-    @broadcastable_method(only_broadcastable_along="space")
     def compute_distance_to(
-        self, point: ArrayLike, boundary_only: bool = False
-    ) -> float:
+        self, point: ArrayLike | xr.DataArray, boundary_only: bool = False
+    ) -> float | xr.DataArray:
         """Compute the distance from the region to a point.
 
         Parameters
         ----------
-        point : ArrayLike
+        point : ArrayLike | xarray.DataArray
             Coordinates of a point, from which to find the nearest point in the
-            region defined by ``self``.
+            region defined by ``self``. An ``xarray.DataArray`` of points may
+            also be provided, in which case distances are computed broadcasting
+            along its ``"space"`` dimension.
         boundary_only : bool, optional
             If ``True``, compute the distance from ``point`` to the boundary of
             the region, rather than the closest point belonging to the region.
@@ -343,45 +413,76 @@ class BaseRegionOfInterest:
 
         Returns
         -------
-        float
+        float | xarray.DataArray
             Euclidean distance from the ``point`` to the (closest point on the)
-            region.
+            region. ``DataArray`` inputs give a ``DataArray`` of distances,
+            with the ``space`` dimension collapsed.
 
         """
-        region_to_consider = (
-            self.region.boundary if boundary_only else self.region
-        )
+        region_to_consider = self._boundary if boundary_only else self.region
+        if isinstance(point, xr.DataArray):
+            # shapely.points builds the whole array of point geometries in
+            # one call, and shapely.distance acts on it like a ufunc,
+            # avoiding a Python-level GEOS dispatch per sample
+            return xr.apply_ufunc(
+                lambda xy: shapely.distance(
+                    region_to_consider, shapely.points(xy)
+                ),
+                point,
+                input_core_dims=[["space"]],
+            )
         return shapely.distance(region_to_consider, shapely.Point(point))
 
-    @broadcastable_method(
-        only_broadcastable_along="space", new_dimension_name="nearest point"
-    )
     def compute_nearest_point_to(
-        self, /, position: ArrayLike, boundary_only: bool = False
-    ) -> np.ndarray:
+        self,
+        /,
+        position: ArrayLike | xr.DataArray,
+        boundary_only: bool = False,
+    ) -> np.ndarray | xr.DataArray:
         """Compute (one of) the nearest point(s) in the region to ``position``.
 
         If there are multiple equidistant points, one of them is returned.
 
         Parameters
         ----------
-        position : ArrayLike
+        position : ArrayLike | xarray.DataArray
             Coordinates of a point, from which to find the nearest point in the
-            region.
+            region. An ``xarray.DataArray`` of points may also be provided, in
+            which case nearest points are computed broadcasting along its
+            ``"space"`` dimension.
         boundary_only : bool, optional
             If ``True``, compute the nearest point to ``position`` that is on
             the  boundary of ``self``. Default ``False``.
 
         Returns
         -------
-        np.ndarray
+        np.ndarray | xarray.DataArray
             Coordinates of the point on ``self`` that is closest to
-            ``position``.
+            ``position``. ``DataArray`` inputs give a ``DataArray`` of
+            coordinates, with the ``space`` dimension replaced by
+            ``"nearest point"``.
 
         """
-        region_to_consider = (
-            self.region.boundary if boundary_only else self.region
-        )
+        region_to_consider = self._boundary if boundary_only else self.region
+        if isinstance(position, xr.DataArray):
+
+            def nearest_points_in_region(xy: np.ndarray) -> np.ndarray:
+                lines = shapely.shortest_line(
+                    region_to_consider,
+                    shapely.points(xy.reshape(-1, xy.shape[-1])),
+                )
+                # get_coordinates stores the lines' coordinates
+                # consecutively, so the even rows hold the line starts,
+                # which are the points on self
+                coords = shapely.get_coordinates(lines)
+                return coords[0::2].reshape(*xy.shape[:-1], 2)
+
+            return xr.apply_ufunc(
+                nearest_points_in_region,
+                position,
+                input_core_dims=[["space"]],
+                output_core_dims=[["nearest point"]],
+            )
         # shortest_line returns a line from 1st arg to 2nd arg,
         # therefore the point on self is the 0th coordinate
         return np.array(
@@ -390,15 +491,12 @@ class BaseRegionOfInterest:
             ).coords[0]
         )
 
-    @broadcastable_method(
-        only_broadcastable_along="space", new_dimension_name="vector to"
-    )
     def compute_approach_vector(
         self,
-        point: ArrayLike,
+        point: ArrayLike | xr.DataArray,
         boundary_only: bool = False,
         unit: bool = False,
-    ) -> np.ndarray:
+    ) -> np.ndarray | xr.DataArray:
         """Compute the approach vector from a ``point`` to the region.
 
         The approach vector is defined as the vector directed from the
@@ -406,9 +504,11 @@ class BaseRegionOfInterest:
 
         Parameters
         ----------
-        point : ArrayLike
+        point : ArrayLike | xarray.DataArray
             Coordinates of a point to compute the vector to (or from) the
-            region.
+            region. An ``xarray.DataArray`` of points may also be provided, in
+            which case approach vectors are computed broadcasting along its
+            ``"space"`` dimension.
         boundary_only : bool
             If ``True``, the approach vector to the boundary of the region is
             computed. Default ``False``.
@@ -418,8 +518,10 @@ class BaseRegionOfInterest:
 
         Returns
         -------
-        np.ndarray
-            Approach vector from the point to the region.
+        np.ndarray | xarray.DataArray
+            Approach vector from the point to the region. ``DataArray`` inputs
+            give a ``DataArray`` of vectors, with the ``space`` dimension
+            replaced by ``"vector to"``.
 
         See Also
         --------
@@ -429,18 +531,45 @@ class BaseRegionOfInterest:
             Relies on this method to compute the approach vector.
 
         """
-        region_to_consider = (
-            self.region.boundary if boundary_only else self.region
-        )
+        region_to_consider = self._boundary if boundary_only else self.region
+        if isinstance(point, xr.DataArray):
+
+            def approach_vectors_to_region(xy: np.ndarray) -> np.ndarray:
+                # "point to region" by virtue of order of arguments
+                lines = shapely.shortest_line(
+                    shapely.points(xy.reshape(-1, xy.shape[-1])),
+                    region_to_consider,
+                )
+                coords = shapely.get_coordinates(lines).reshape(-1, 2, 2)
+                vectors = coords[:, 1, :] - coords[:, 0, :]
+                if unit:
+                    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+                    # Cannot normalise the 0 vectors; divide in place where
+                    # the norm is nonzero and leave the rest untouched
+                    np.divide(
+                        vectors,
+                        norms,
+                        out=vectors,
+                        where=~np.isclose(norms, 0.0),
+                    )
+                return vectors.reshape(*xy.shape[:-1], 2)
+
+            return xr.apply_ufunc(
+                approach_vectors_to_region,
+                point,
+                input_core_dims=[["space"]],
+                output_core_dims=[["vector to"]],
+            )
 
         # "point to region" by virtue of order of arguments to shapely call
         directed_line = shapely.shortest_line(
             shapely.Point(point), region_to_consider
         )
 
-        approach_vector = np.array(directed_line.coords[1]) - np.array(
-            directed_line.coords[0]
-        )
+        # get_coordinates unpacks both endpoints in one C call, rather
+        # than indexing the CoordinateSequence twice
+        line_coords = shapely.get_coordinates(directed_line)
+        approach_vector = line_coords[1] - line_coords[0]
         if unit:
             norm = np.sqrt(np.sum(approach_vector**2))
             # Cannot normalise the 0 vector
@@ -494,7 +623,7 @@ class BaseRegionOfInterest:
 
         """
         if reference_vector is None:
-            reference_vector = np.array([[1.0, 0.0]])
+            reference_vector = _DEFAULT_REFERENCE_VECTOR
 
         return self._boundary_angle_computation(
             position=position,
@@ -71,8 +71,8 @@ class LineOfInterest(BaseRegionOfInterest):
     ) -> tuple[plt.Figure, plt.Axes]:
         """LinesOfInterest can simply be plotted as lines."""
         ax.plot(
-            [c[0] for c in self.coords],
-            [c[1] for c in self.coords],
+            self._coords_np[:, 0],
+            self._coords_np[:, 1],
             **matplotlib_kwargs,
         )
         return fig, ax
@@ -107,20 +107,18 @@ class LineOfInterest(BaseRegionOfInterest):
 
         """
         # A multi-segment geometry always has at least 3 coordinates.
-        if len(self.coords) > 2:
+        if len(self._coords_np) > 2:
             raise ValueError(
                 "Normal is not defined for multi-segment geometries."
             )
 
         on_same_side_as = np.array(on_same_side_as)
 
-        parallel_to_line = np.array(self.region.coords[1]) - np.array(
-            self.region.coords[0]
-        )
+        parallel_to_line = self._coords_np[1] - self._coords_np[0]
         normal = np.array([parallel_to_line[1], -parallel_to_line[0]])
         normal /= np.sqrt(np.sum(normal**2))
 
-        if np.dot((on_same_side_as - self.region.coords[0]), normal) < 0:
+        if np.dot((on_same_side_as - self._coords_np[0]), normal) < 0:
             normal *= -1.0
         return normal
 
@@ -7,6 +7,7 @@ from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
+import shapely
 from matplotlib.patches import PathPatch as PltPatch
 from matplotlib.path import Path as PltPath
 
@@ -81,9 +82,10 @@ class PolygonOfInterest(BaseRegionOfInterest):
     @property
     def exterior_boundary(self) -> LineOfInterest:
         """The exterior boundary of this RoI."""
-        return LineOfInterest(
-            self.region.exterior.coords,
-            loop=True,
+        # The ring geometries already exist, so wrap them directly rather
+        # than re-validating their coordinates through the constructor
+        return LineOfInterest._from_geometry(
+            shapely.normalize(shapely.LinearRing(self.region.exterior.coords)),
             name=f"Exterior boundary of {self.name}",
         )
 
@@ -96,8 +98,9 @@ class PolygonOfInterest(BaseRegionOfInterest):
         doughnut, for example). A region with no holes returns the empty tuple.
         """
         return tuple(
-            PolygonOfInterest(
-                int_boundary.coords, name=f"Hole {i} of {self.name}"
+            PolygonOfInterest._from_geometry(
+                shapely.Polygon(shell=int_boundary.coords),
+                name=f"Hole {i} of {self.name}",
             )
             for i, int_boundary in enumerate(self.region.interiors)
         )
@@ -110,9 +113,8 @@ class PolygonOfInterest(BaseRegionOfInterest):
         polygon.  A region with no holes returns the empty tuple.
         """
         return tuple(
-            LineOfInterest(
-                int_boundary.coords,
-                loop=True,
+            LineOfInterest._from_geometry(
+                shapely.normalize(shapely.LinearRing(int_boundary.coords)),
                 name=f"Interior boundary {i} of {self.name}",
             )
             for i, int_boundary in enumerate(self.region.interiors)
@@ -85,11 +85,23 @@ def report_nan_values(da: xr.DataArray, label: str | None = None) -> str:
     individuals = da.individuals.values if has_individuals_dim else [None]
     keypoints = da.keypoints.values if has_keypoints_dim else [None]
 
+    # Count NaNs for all individuals and keypoints in a single pass,
+    # rather than re-scanning the data for each combination
+    nan_counts = da.isnull().any(["space"]).sum(["time"])
+    n_points = da.time.size
+
     for ind in individuals:
         ind_name = ind if ind is not None else da.individuals.item()
         nan_report += f"\n\tIndividual: {ind_name}"
         for kp in keypoints:
-            nan_report += calculate_nan_stats(da, keypoint=kp, individual=ind)
+            selection_criteria = {}
+            if ind is not None:
+                selection_criteria["individuals"] = ind
+            if kp is not None:
+                selection_criteria["keypoints"] = kp
+            n_nans = nan_counts.sel(**selection_criteria).item()
+            percent_nans = round((n_nans / n_points) * 100, 1)
+            nan_report += f"\n\t\t{kp}: {n_nans}/{n_points} ({percent_nans}%)"
     # Write nan report to logger
     logger.info(nan_report)
     return nan_report
@@ -18,6 +18,9 @@ def _convert_to_list_of_str(value: str | Iterable[Any]) -> list[str]:
             "Converting to a list of length 1."
         )
         return [value]
+    elif isinstance(value, list) and all(type(item) is str for item in value):
+        # fast path: already a list of strings, no per-item conversion
+        return value
     elif isinstance(value, Iterable):
         return [str(item) for item in value]
     else:
@@ -37,6 +40,18 @@ def _convert_fps_to_none_if_invalid(fps: float | None) -> float | None:
     return fps
 
 
+def _convert_to_c_contiguous(value: Any) -> Any:
+    """Make numpy array values C-contiguous, passing through anything else.
+
+    Already-contiguous arrays are returned as-is (no copy). Non-array
+    values are left untouched, so that the type validators can report
+    them as usual.
+    """
+    if isinstance(value, np.ndarray) and not value.flags.c_contiguous:
+        return np.ascontiguousarray(value)
+    return value
+
+
 def _validate_type_ndarray(value: Any) -> None:
     """Raise ValueError the value is a not numpy array."""
     if not isinstance(value, np.ndarray):
@@ -120,10 +135,12 @@ class ValidPosesDataset:
     """
 
     # Required attributes
-    position_array: np.ndarray = field()
+    position_array: np.ndarray = field(converter=_convert_to_c_contiguous)
 
     # Optional attributes
-    confidence_array: np.ndarray | None = field(default=None)
+    confidence_array: np.ndarray | None = field(
+        default=None, converter=_convert_to_c_contiguous
+    )
     individual_names: list[str] | None = field(
         default=None,
         converter=converters.optional(_convert_to_list_of_str),
@@ -181,6 +198,8 @@ class ValidPosesDataset:
 
     @individual_names.validator
     def _validate_individual_names(self, attribute, value):
+        if value is None:
+            return  # default names are assigned in __attrs_post_init__
         if self.source_software == "LightningPose":
             # LightningPose only supports a single individual
             _validate_list_length(attribute, value, 1)
@@ -191,17 +210,19 @@ class ValidPosesDataset:
 
     @keypoint_names.validator
     def _validate_keypoint_names(self, attribute, value):
+        if value is None:
+            return  # default names are assigned in __attrs_post_init__
         _validate_list_length(attribute, value, self.position_array.shape[2])
 
     def __attrs_post_init__(self):
         """Assign default values to optional attributes (if None)."""
         position_array_shape = self.position_array.shape
         if self.confidence_array is None:
-            self.confidence_array = np.full(
+            self.confidence_array = np.empty(
                 position_array_shape[:1] + position_array_shape[2:],
-                np.nan,
                 dtype="float32",
             )
+            self.confidence_array.fill(np.nan)
             log_warning(
                 "Confidence array was not provided."
                 "Setting to an array of NaNs."
@@ -286,18 +307,22 @@ class ValidBboxesDataset:
     """
 
     # Required attributes
-    position_array: np.ndarray = field()
-    shape_array: np.ndarray = field()
+    position_array: np.ndarray = field(converter=_convert_to_c_contiguous)
+    shape_array: np.ndarray = field(converter=_convert_to_c_contiguous)
 
     # Optional attributes
-    confidence_array: np.ndarray | None = field(default=None)
+    confidence_array: np.ndarray | None = field(
+        default=None, converter=_convert_to_c_contiguous
+    )
     individual_names: list[str] | None = field(
         default=None,
         converter=converters.optional(
             _convert_to_list_of_str
         ),  # force into list of strings if not
     )
-    frame_array: np.ndarray | None = field(default=None)
+    frame_array: np.ndarray | None = field(
+        default=None, converter=_convert_to_c_contiguous
+    )
     fps: float | None = field(
         default=None,
         converter=converters.pipe(  # type: ignore
@@ -387,11 +412,11 @@ class ValidBboxesDataset:
         position_array_shape = self.position_array.shape
         # assign default confidence_array
         if self.confidence_array is None:
-            self.confidence_array = np.full(
+            self.confidence_array = np.empty(
                 position_array_shape[:1] + position_array_shape[2:],
-                np.nan,
                 dtype="float32",
             )
+            self.confidence_array.fill(np.nan)
             log_warning(
                 "Confidence array was not provided. "
                 "Setting to an array of NaNs."
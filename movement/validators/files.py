@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Literal
 
 import h5py
+import numpy as np
 import pandas as pd
 from attrs import define, field, validators
 
@@ -93,15 +94,17 @@ class ValidFile:
 
         Raises a PermissionError if not.
         """
-        file_is_readable = os.access(value, os.R_OK)
-        parent_is_writeable = os.access(value.parent, os.W_OK)
-        if ("r" in self.expected_permission) and (not file_is_readable):
+        if ("r" in self.expected_permission) and (
+            not os.access(value, os.R_OK)
+        ):
             raise log_error(
                 PermissionError,
                 f"Unable to read file: {value}. "
                 "Make sure that you have read permissions.",
             )
-        if ("w" in self.expected_permission) and (not parent_is_writeable):
+        if ("w" in self.expected_permission) and (
+            not os.access(value.parent, os.W_OK)
+        ):
             raise log_error(
                 PermissionError,
                 f"Unable to write to file: {value}. "
@@ -148,30 +151,29 @@ class ValidHDF5:
     expected_datasets: list[str] = field(factory=list, kw_only=True)
 
     @path.validator
-    def _file_is_h5(self, attribute, value):
-        """Ensure that the file is indeed in HDF5 format."""
+    def _file_is_h5_and_contains_expected_datasets(self, attribute, value):
+        """Ensure the file is in HDF5 format with the expected datasets.
+
+        Both checks share a single open of the file.
+        """
         try:
-            with h5py.File(value, "r") as f:
-                f.close()
+            with h5py.File(value, "r", libver="latest") as f:
+                file_keys = set(f.keys())
         except Exception as e:
             raise log_error(
                 ValueError,
                 f"File {value} does not seem to be in validHDF5 format.",
             ) from e
-
-    @path.validator
-    def _file_contains_expected_datasets(self, attribute, value):
-        """Ensure that the HDF5 file contains the expected datasets."""
-        if self.expected_datasets:
-            with h5py.File(value, "r") as f:
-                diff = set(self.expected_datasets).difference(set(f.keys()))
-                if len(diff) > 0:
-                    raise log_error(
-                        ValueError,
-                        f"Could not find the expected dataset(s) {diff} "
-                        f"in file: {value}. Make sure that the file "
-                        "matches the expected source software format.",
-                    )
+        if self.expected_datasets and not file_keys.issuperset(
+            self.expected_datasets
+        ):
+            diff = set(self.expected_datasets).difference(file_keys)
+            raise log_error(
+                ValueError,
+                f"Could not find the expected dataset(s) {diff} "
+                f"in file: {value}. Make sure that the file "
+                "matches the expected source software format.",
+            )
 
 
 @define
@@ -204,22 +206,35 @@ class ValidDeepLabCutCSV:
         """
         expected_levels = ["scorer", "bodyparts", "coords"]
 
+        # Read the top of the file in one go, rather than line by line;
+        # top up in case the first 4 rows are longer than the initial chunk
+        # (e.g. files with many keypoints).
         with open(value) as f:
-            top4_row_starts = [f.readline().split(",")[0] for _ in range(4)]
-
-            if top4_row_starts[3].isdigit():
-                # if 4th row starts with a digit, assume single-animal DLC file
-                expected_levels.append(top4_row_starts[3])
-            else:
-                # otherwise, assume multi-animal DLC file
-                expected_levels.insert(1, "individuals")
+            chunk = f.read(4096)
+            while chunk.count("\n") < 4:
+                more = f.read(4096)
+                if not more:
+                    break
+                chunk += more
+        top4_rows = chunk.splitlines()[:4]
+        top4_row_starts = [row.split(",", 1)[0] for row in top4_rows]
+        # pad with empty strings if the file has fewer than 4 rows,
+        # as readline() would have returned
+        top4_row_starts += [""] * (4 - len(top4_row_starts))
+
+        if top4_row_starts[3].isdigit():
+            # if 4th row starts with a digit, assume single-animal DLC file
+            expected_levels.append(top4_row_starts[3])
+        else:
+            # otherwise, assume multi-animal DLC file
+            expected_levels.insert(1, "individuals")
 
-            if top4_row_starts != expected_levels:
-                raise log_error(
-                    ValueError,
-                    ".csv header rows do not match the known format for "
-                    "DeepLabCut pose estimation output files.",
-                )
+        if top4_row_starts != expected_levels:
+            raise log_error(
+                ValueError,
+                ".csv header rows do not match the known format for "
+                "DeepLabCut pose estimation output files.",
+            )
 
 
 @define
@@ -433,37 +448,44 @@ class ValidVIATracksCSV:
     def _extract_frame_numbers_using_regexp(self, df):
         """Get frame numbers from the file names using the provided regexp."""
         list_frame_numbers = []
-        for f_i, f in enumerate(df["filename"]):
-            # try compiling the frame regexp
-            try:
-                regex_match = re.search(self.frame_regexp, f)
-            except re.error as e:
-                raise log_error(
-                    re.error,
-                    "The provided regular expression for the frame "
-                    f"numbers ({self.frame_regexp}) could not be compiled."
-                    " Please review its syntax.",
-                ) from e
-            # try extracting the frame number from the filename using the
-            # compiled regexp
-            try:
-                list_frame_numbers.append(int(regex_match.group(1)))
-            except AttributeError as e:
-                raise log_error(
-                    AttributeError,
-                    f"{f} (row {f_i}): The provided frame regexp "
-                    f"({self.frame_regexp}) did not "
-                    "return any matches and a frame number could not "
-                    "be extracted from the filename.",
-                ) from e
-            except ValueError as e:
-                raise log_error(
-                    ValueError,
-                    f"{f} (row {f_i}): "
-                    "The frame number extracted from the filename using "
-                    f"the provided regexp ({self.frame_regexp}) could not "
-                    "be cast as an integer.",
-                ) from e
+        # try compiling the frame regexp once, rather than on every filename
+        try:
+            compiled_regexp = re.compile(self.frame_regexp)
+        except re.error as e:
+            raise log_error(
+                re.error,
+                "The provided regular expression for the frame "
+                f"numbers ({self.frame_regexp}) could not be compiled."
+                " Please review its syntax.",
+            ) from e
+        # extract the first capture group for all filenames in one
+        # vectorised pass, instead of matching row by row
+        first_group = df["filename"].str.extract(compiled_regexp).iloc[:, 0]
+        no_match = first_group.isna().to_numpy()
+        if no_match.any():
+            f_i = int(np.argmax(no_match))
+            raise log_error(
+                AttributeError,
+                f"{df['filename'].iloc[f_i]} (row {f_i}): "
+                f"The provided frame regexp ({self.frame_regexp}) did not "
+                "return any matches and a frame number could not "
+                "be extracted from the filename.",
+            )
+        # cast the extracted strings to integers, also in one pass
+        frame_numbers = pd.to_numeric(first_group, errors="coerce")
+        not_an_integer = (
+            frame_numbers.isna() | (frame_numbers % 1 != 0)
+        ).to_numpy()
+        if not_an_integer.any():
+            f_i = int(np.argmax(not_an_integer))
+            raise log_error(
+                ValueError,
+                f"{df['filename'].iloc[f_i]} (row {f_i}): "
+                "The frame number extracted from the filename using "
+                f"the provided regexp ({self.frame_regexp}) could not "
+                "be cast as an integer.",
+            )
+        list_frame_numbers = frame_numbers.astype(int).to_list()
 
         return list_frame_numbers
 
@@ -26,13 +26,11 @@ def push_into_range() -> Callable[
         such as (-pi, pi].
 
         The interval width is the value ``upper - lower``.
-        Each element in ``values`` that starts less than or equal to the
-        ``lower`` bound has multiples of the interval width added to it,
-        until the result lies in the desirable interval.
-
-        Each element in ``values`` that starts greater than the ``upper``
-        bound has multiples of the interval width subtracted from it,
-        until the result lies in the desired interval.
+        Each element in ``values`` outside the desired interval is shifted
+        by the appropriate multiple of the interval width, computed in a
+        single modulo operation (rather than repeatedly shifting by one
+        interval width until the value lands in range). Elements already
+        in the interval are left untouched.
         """
         translated_values = (
             numeric_values.values.copy()
@@ -47,11 +45,14 @@ def push_into_range() -> Callable[
                 f"greater than lower bound ({lower})"
             )
 
-        while np.any(
-            (translated_values <= lower) | (translated_values > upper)
-        ):
-            translated_values[translated_values <= lower] += interval_width
-            translated_values[translated_values > upper] -= interval_width
+        out_of_range = (translated_values <= lower) | (
+            translated_values > upper
+        )
+        shifted = (translated_values[out_of_range] - lower) % interval_width
+        # values an exact multiple of the width from the upper bound
+        # should map to the upper bound, not the (open) lower bound
+        shifted[shifted == 0] = interval_width
+        translated_values[out_of_range] = shifted + lower
 
         if isinstance(numeric_values, xr.DataArray):
             translated_values = numeric_values.copy(
@@ -101,14 +101,19 @@ def test_valid_dataset_to_napari_tracks(ds_name, request):
     )
 
     # Generate expected properties DataFrame
+    # (individual and keypoint are stored as categoricals)
     expected_props_dict = {
-        "individual": np.repeat(
-            ds.individuals.values.repeat(n_keypoints), n_frames
+        "individual": pd.Categorical(
+            np.repeat(ds.individuals.values.repeat(n_keypoints), n_frames),
+            categories=ds.individuals.values,
         ),
         **(
             {
-                "keypoint": np.repeat(
-                    np.tile(ds.keypoints.values, n_individuals), n_frames
+                "keypoint": pd.Categorical(
+                    np.repeat(
+                        np.tile(ds.keypoints.values, n_individuals), n_frames
+                    ),
+                    categories=ds.keypoints.values,
                 )
             }
             if "keypoints" in ds
@@ -126,6 +131,27 @@ def test_valid_dataset_to_napari_tracks(ds_name, request):
     assert_frame_equal(props, expected_props)
 
 
+@pytest.mark.parametrize(
+    "ds_name",
+    ["valid_poses_dataset_with_nan", "valid_bboxes_dataset_with_nan"],
+)
+def test_ds_to_napari_tracks_valid_mask(ds_name, request):
+    """Test that the optional valid mask flags rows with NaN positions."""
+    ds = request.getfixturevalue(ds_name)
+    n_frames = ds.sizes["time"]
+    n_tracks = ds.sizes["individuals"] * ds.sizes.get("keypoints", 1)
+
+    data, _, valid_mask = ds_to_napari_tracks(ds, return_valid_mask=True)
+
+    # One mask entry per row of the tracks array, False wherever the
+    # row's y or x position is NaN
+    assert valid_mask.shape == (n_tracks * n_frames,)
+    np.testing.assert_array_equal(
+        valid_mask, ~np.isnan(data[:, 2:]).any(axis=1)
+    )
+    assert not valid_mask.all()  # the fixtures contain NaN positions
+
+
 @pytest.mark.parametrize(
     "ds_name, expected_exception",
     [